@@ -2,8 +2,7 @@ import argparse
 import asyncio
 import sys
 
-from src.application import Application
-from src.utils.logging_config import get_logger, setup_logging
+from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
@@ -73,7 +72,9 @@ async def start_app(mode: str, protocol: str, skip_activation: bool) -> int:
     else:
         logger.warning("Bỏ qua quy trình kích hoạt (chế độ thử nghiệm)")
 
-    # Tạo và khởi động ứng dụng
+    # Tạo và khởi động ứng dụng (import trì hoãn để --help không phải nạp toàn bộ src.application)
+    from src.application import Application
+
     app = Application.get_instance()
     return await app.run(mode=mode, protocol=protocol)
 
@@ -82,6 +83,9 @@ if __name__ == "__main__":
     exit_code = 1
     try:
         args = parse_args()
+
+        from src.utils.logging_config import setup_logging
+
         setup_logging()
 
         if args.mode == "gui":
@@ -9,8 +9,6 @@ from typing import Set
 
 from src.constants.constants import AbortReason, DeviceState, ListeningMode
 from src.mcp.mcp_server import McpServer
-from src.protocols.mqtt_protocol import MqttProtocol
-from src.protocols.websocket_protocol import WebsocketProtocol
 from src.utils.common_utils import handle_verification_code
 from src.utils.config_manager import ConfigManager
 from src.utils.logging_config import get_logger
@@ -444,9 +442,14 @@ class Application:
         设置协议类型.
         """
         logger.debug("设置协议类型: %s", protocol_type)
+        # 按需导入协议后端，避免未使用的依赖（paho-mqtt/cryptography 或 websockets）拖慢启动
         if protocol_type == "mqtt":
+            from src.protocols.mqtt_protocol import MqttProtocol
+
             self.protocol = MqttProtocol(asyncio.get_running_loop())
         else:
+            from src.protocols.websocket_protocol import WebsocketProtocol
+
             self.protocol = WebsocketProtocol()
 
     def _set_display_type(self, mode: str):
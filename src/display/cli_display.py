@@ -1,23 +1,78 @@
 import asyncio
+import codecs
 import logging
 import os
+import select
 import shutil
+import signal
 import sys
 import termios
+import time
 import tty
+import unicodedata
 from collections import deque
 from typing import Callable, Optional
 
 from src.display.base_display import BaseDisplay
 
+# Shared formatter for log records forwarded to the CLI display area
+_LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(name)s] - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class _DisplayLogHandler(logging.Handler):
+    """
+    Forward log records into the CLI display buffer.
+    """
+
+    def __init__(self, display: "CliDisplay"):
+        super().__init__()
+        self.display = display
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            display = self.display
+            # Non-TTY output has no display area to show logs in, skip formatting
+            if not display._use_ansi:
+                return
+            msg = self.format(record)
+            log_lines = display._log_lines
+            # Drop exact repeats of the last line, they would not change the display
+            if log_lines and log_lines[-1] == msg:
+                return
+            log_lines.append(msg)
+            loop = display._loop
+            if loop:
+                # Only mark dirty; the render loop coalesces bursts
+                loop.call_soon_threadsafe(display._dirty.set)
+        except Exception:
+            pass
+
 
 class CliDisplay(BaseDisplay):
     def __init__(self):
         super().__init__()
         self.running = True
         self._use_ansi = sys.stdout.isatty()
+        # Render output goes straight to the stdout fd (bypassing TextIOWrapper)
+        self._stdout_fd = self._get_stdout_fd() if self._use_ansi else None
         self._loop = None
         self._last_drawn_rows = 0
+        # Last drawn body lines and width, used to only rewrite changed rows
+        self._last_body: list[str] = []
+        self._last_cols = 0
+        # "Move to row N, column 1 + clear line" sequences, indexed by row - 1
+        self._row_motions: list[str] = []
+
+        # Render coalescing: setters only mark dirty, a single task redraws
+        self._dirty = asyncio.Event()
+        self._last_render_mono = 0.0
+        self._render_interval = 0.03
+
+        # Terminal size cache (refreshed on SIGWINCH instead of queried per render)
+        self._cached_size = self._query_term_size()
 
         # Dashboard data (top content display area)
         self._dash_status = ""
@@ -40,6 +95,21 @@ class CliDisplay(BaseDisplay):
             "yellow": "\x1b[33m",
             "magenta": "\x1b[35m",
         }
+        # Precomputed style strings (avoid rebuilding on every render)
+        self._reset = self._ansi["reset"] if self._use_ansi else ""
+        self._green = self._ansi["green"] if self._use_ansi else ""
+        self._title = (
+            f"{self._ansi['bold']}{self._ansi['cyan']} XiaoZhi AI Terminal {self._reset}"
+            if self._use_ansi
+            else " XiaoZhi AI Terminal "
+        )
+        self._prompt_str = (
+            f"{self._ansi['bold']}{self._ansi['cyan']}Input:{self._reset} "
+            if self._use_ansi
+            else "Input: "
+        )
+        # Frame borders cache keyed by terminal width
+        self._frame_cache: dict[int, tuple[str, str, str, str]] = {}
 
         # Callback functions
         self.auto_callback = None
@@ -49,6 +119,31 @@ class CliDisplay(BaseDisplay):
 
         # Async queue for processing commands
         self.command_queue = asyncio.Queue()
+        # Single-character command dispatch table
+        self._command_handlers = {
+            "q": self.close,
+            "h": self._cmd_help,
+            "r": self._cmd_auto,
+            "x": self._cmd_abort,
+        }
+
+        # Bounded queue between keyboard reader and command dispatcher
+        self._input_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._text_batch_window = 0.01
+
+        # Raw stdin state (terminal switched to cbreak once, read via loop.add_reader)
+        self._stdin_fd: Optional[int] = None
+        self._old_term_settings = None
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stdin_readahead = 1024
+        # Escape sequence parser state, kept across reads like the UTF-8 decoder:
+        # "" (none), "esc" (after \x1b), "seq" (inside CSI/SS3, waiting for final byte)
+        self._esc_state = ""
+        self._line_buffer: list[str] = []
+        # Display width (terminal cells) of the current line, CJK chars take 2 cells
+        self._line_cells = 0
+        self._widths: dict[str, int] = {}
 
         # Log buffer (only displayed at the top of CLI, not printed directly to console)
         self._log_lines: deque[str] = deque(maxlen=6)
@@ -76,47 +171,89 @@ class CliDisplay(BaseDisplay):
         Update button status.
         """
         # Simplified: button status is only shown in dashboard text
+        if text == self._dash_text:
+            return
         self._dash_text = text
-        await self._render_dashboard()
+        self._dirty.set()
 
     async def update_status(self, status: str, connected: bool):
         """
         Update status (only updates dashboard, does not append new line).
         """
+        connected = bool(connected)
+        if status == self._dash_status and connected == self._dash_connected:
+            return
         self._dash_status = status
-        self._dash_connected = bool(connected)
-        await self._render_dashboard()
+        self._dash_connected = connected
+        self._dirty.set()
 
     async def update_text(self, text: str):
         """
         Update text (only updates dashboard, does not append new line).
         """
-        if text and text.strip():
-            self._dash_text = text.strip()
-            await self._render_dashboard()
+        if not text:
+            return
+        text = text.strip()
+        if text and text != self._dash_text:
+            self._dash_text = text
+            self._dirty.set()
 
     async def update_emotion(self, emotion_name: str):
         """
         Update emotion (only updates dashboard, does not append new line).
         """
+        if emotion_name == self._dash_emotion:
+            return
         self._dash_emotion = emotion_name
-        await self._render_dashboard()
+        self._dirty.set()
 
     async def start(self):
         """
         Start async CLI display.
         """
         self._loop = asyncio.get_running_loop()
+        self._install_resize_handler()
         await self._init_screen()
 
         # Start command processor task
-        command_task = asyncio.create_task(self._command_processor())
-        input_task = asyncio.create_task(self._keyboard_input_loop())
+        self._dispatch_task = asyncio.create_task(self._input_dispatcher())
+        tasks = [
+            asyncio.create_task(self._command_processor()),
+            self._dispatch_task,
+            asyncio.create_task(self._render_loop()),
+        ]
+        # In TTY, keystrokes are read by an event loop reader; otherwise fall back to input()
+        if not self._start_raw_input():
+            tasks.append(asyncio.create_task(self._keyboard_input_loop()))
 
         try:
-            await asyncio.gather(command_task, input_task)
+            await asyncio.gather(*tasks)
         except KeyboardInterrupt:
             await self.close()
+        finally:
+            self._stop_raw_input()
+
+    async def _render_loop(self):
+        """
+        Single renderer: coalesce dirty marks into at most one redraw per interval.
+        """
+        while self.running:
+            try:
+                await self._dirty.wait()
+                if not self.running:
+                    break
+                # Render immediately after inactivity, otherwise wait out the interval
+                remaining = self._render_interval - (
+                    time.monotonic() - self._last_render_mono
+                )
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                self._dirty.clear()
+                await self._render_dashboard()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Render loop error: {e}")
 
     async def _command_processor(self):
         """
@@ -124,13 +261,14 @@ class CliDisplay(BaseDisplay):
         """
         while self.running:
             try:
-                command = await asyncio.wait_for(self.command_queue.get(), timeout=1.0)
+                command = await self.command_queue.get()
+                if command is None:
+                    # Shutdown sentinel
+                    break
                 if asyncio.iscoroutinefunction(command):
                     await command()
                 else:
                     command()
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -138,45 +276,83 @@ class CliDisplay(BaseDisplay):
 
     async def _keyboard_input_loop(self):
         """
-        Keyboard input loop.
+        Line-buffered keyboard input loop (used when stdin/stdout is not a TTY).
         """
         try:
             while self.running:
-                # In TTY, always use bottom input area to read input
-                if self._use_ansi:
-                    await self._render_input_area()
-                    # Take over input (disable terminal echo), redraw input line char by char, fixing Chinese first-character residue issue
-                    cmd = await asyncio.to_thread(self._read_line_raw)
-                    # Clear input area (including possible Chinese line-break residue) and refresh dashboard
-                    self._clear_input_area()
-                    await self._render_dashboard()
-                else:
+                try:
                     cmd = await asyncio.to_thread(input)
-                await self._handle_command(cmd.lower().strip())
+                except EOFError:
+                    # stdin closed: let the dispatcher send what is still queued
+                    self._enqueue_input(None)
+                    if self._dispatch_task:
+                        await self._dispatch_task
+                    return
+                self._enqueue_input(cmd)
         except asyncio.CancelledError:
             pass
 
-    # ===== Intercept logs and forward to display area =====
-    def _install_log_handler(self) -> None:
-        class _DisplayLogHandler(logging.Handler):
-            def __init__(self, display: "CliDisplay"):
-                super().__init__()
-                self.display = display
+    def _enqueue_input(self, line: Optional[str]) -> None:
+        """
+        Push a line onto the input queue, dropping the oldest entry when full.
+        """
+        try:
+            self._input_queue.put_nowait(line)
+        except asyncio.QueueFull:
+            try:
+                self._input_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.logger.warning("Input queue full, dropping oldest input")
+            self._input_queue.put_nowait(line)
 
-            def emit(self, record: logging.LogRecord) -> None:
-                try:
-                    msg = self.format(record)
-                    self.display._log_lines.append(msg)
-                    loop = self.display._loop
-                    if loop and self.display._use_ansi:
-                        loop.call_soon_threadsafe(
-                            lambda: asyncio.create_task(
-                                self.display._render_dashboard()
-                            )
+    async def _input_dispatcher(self):
+        """
+        Dispatch queued input: commands run immediately, consecutive text lines
+        arriving within a short window are joined with spaces into a single send.
+        """
+        pending: list[str] = []
+        while self.running:
+            try:
+                if pending:
+                    try:
+                        line = await asyncio.wait_for(
+                            self._input_queue.get(), timeout=self._text_batch_window
                         )
-                except Exception:
-                    pass
+                    except asyncio.TimeoutError:
+                        await self._flush_text(pending)
+                        continue
+                else:
+                    line = await self._input_queue.get()
+
+                if line is None:
+                    # Shutdown sentinel: send any batched text before exiting
+                    await self._flush_text(pending)
+                    break
+                # Only short input can be a command; text is forwarded as typed
+                stripped = line.strip()
+                if len(stripped) == 1 and stripped.lower() in self._command_handlers:
+                    await self._flush_text(pending)
+                    await self._handle_command(stripped.lower())
+                elif stripped:
+                    pending.append(line)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                pending.clear()
+                self.logger.error(f"Input dispatch error: {e}")
+
+    async def _flush_text(self, pending: list[str]) -> None:
+        if not pending:
+            return
+        # Join with spaces: the text is shown on a single dashboard row
+        text = " ".join(pending)
+        pending.clear()
+        if self.send_text_callback:
+            await self.send_text_callback(text)
 
+    # ===== Intercept logs and forward to display area =====
+    def _install_log_handler(self) -> None:
         root = logging.getLogger()
         # Remove handlers that write directly to stdout/stderr to avoid overwriting rendering
         for h in list(root.handlers):
@@ -186,39 +362,47 @@ class CliDisplay(BaseDisplay):
             ):
                 root.removeHandler(h)
 
+        # Reuse an already installed handler (e.g. display recreated) instead of stacking
+        for h in root.handlers:
+            if isinstance(h, _DisplayLogHandler):
+                h.display = self
+                return
+
         handler = _DisplayLogHandler(self)
         handler.setLevel(logging.WARNING)
-        handler.setFormatter(
-            logging.Formatter(
-                fmt="%(asctime)s [%(name)s] - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+        handler.setFormatter(_LOG_FORMATTER)
         root.addHandler(handler)
 
     async def _handle_command(self, cmd: str):
         """
-        Handle commands.
+        Handle single-character commands (text input is sent via _flush_text).
         """
-        if cmd == "q":
-            await self.close()
-        elif cmd == "h":
-            self._print_help()
-        elif cmd == "r":
-            if self.auto_callback:
-                await self.command_queue.put(self.auto_callback)
-        elif cmd == "x":
-            if self.abort_callback:
-                await self.command_queue.put(self.abort_callback)
-        else:
-            if self.send_text_callback:
-                await self.send_text_callback(cmd)
+        handler = self._command_handlers.get(cmd)
+        if handler:
+            await handler()
+
+    async def _cmd_help(self):
+        self._print_help()
+
+    async def _cmd_auto(self):
+        if self.auto_callback:
+            await self.command_queue.put(self.auto_callback)
+
+    async def _cmd_abort(self):
+        if self.abort_callback:
+            await self.command_queue.put(self.abort_callback)
 
     async def close(self):
         """
         Close CLI display.
         """
         self.running = False
+        self._remove_resize_handler()
+        self._stop_raw_input()
+        # Wake the render loop, input dispatcher and command processor so they can exit
+        self._dirty.set()
+        self._enqueue_input(None)
+        self.command_queue.put_nowait(None)
         print("\nClosing application...\n")
 
     def _print_help(self):
@@ -227,95 +411,299 @@ class CliDisplay(BaseDisplay):
         """
         help_text = "r: start/stop | x: abort | q: quit | h: help | others: send text"
         self._dash_text = help_text
+        self._dirty.set()
 
     async def _init_screen(self):
         """
         Initialize screen and render two areas (display area + input area).
         """
         if self._use_ansi:
-            # Clear screen and move to top left
-            sys.stdout.write("\x1b[2J\x1b[H")
+            # Flush anything already buffered so it is not emitted after raw writes
             sys.stdout.flush()
+            # Clear screen and move to top left
+            self._write(["\x1b[2J\x1b[H"])
 
         # Initial full render
         await self._render_dashboard(full=True)
-        await self._render_input_area()
+        self._render_input_area()
+
+    def _goto(self, row: int, col: int = 1) -> str:
+        return f"\x1b[{max(1,row)};{max(1,col)}H"
+
+    def _clear_row(self, row: int) -> str:
+        """
+        Escape sequence moving to column 1 of a row and clearing it (cached per row).
+        """
+        row = max(1, row)
+        motions = self._row_motions
+        if row > len(motions):
+            motions.extend(
+                f"\x1b[{r};1H\x1b[2K" for r in range(len(motions) + 1, row + 1)
+            )
+        return motions[row - 1]
+
+    @staticmethod
+    def _get_stdout_fd() -> Optional[int]:
+        try:
+            return sys.stdout.fileno()
+        except (AttributeError, ValueError, OSError):
+            return None
+
+    def _write(self, parts: list[str]) -> None:
+        """
+        Emit a batch of output fragments, normally with a single os.write.
+        """
+        fd = self._stdout_fd
+        if fd is None:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
+            return
+        data = memoryview("".join(parts).encode("utf-8"))
+        while data:
+            try:
+                written = os.write(fd, data)
+            except BlockingIOError:
+                # Non-blocking stdout is full, wait until it is writable again
+                select.select([], [fd], [])
+                continue
+            data = data[written:]
 
-    def _goto(self, row: int, col: int = 1):
-        sys.stdout.write(f"\x1b[{max(1,row)};{max(1,col)}H")
+    def _frames(self, cols: int) -> tuple[str, str, str, str]:
+        """
+        Return (top_bar, sep_line, bottom_bar, title_line) for the given width, memoized.
+        """
+        frames = self._frame_cache.get(cols)
+        if frames is None:
+            inner = max(2, cols - 2)
+            bar = "─" * inner
+            frames = (
+                "┌" + bar + "┐",
+                "├" + bar + "┤",
+                "└" + bar + "┘",
+                "│" + self._title.center(inner) + "│",
+            )
+            # Keep only a handful of widths (terminal resizes are rare)
+            if len(self._frame_cache) >= 8:
+                self._frame_cache.pop(next(iter(self._frame_cache)))
+            self._frame_cache[cols] = frames
+        return frames
 
-    def _term_size(self):
+    def _query_term_size(self) -> tuple[int, int]:
         try:
             size = shutil.get_terminal_size(fallback=(80, 24))
             return size.columns, size.lines
         except Exception:
             return 80, 24
 
+    def _term_size(self) -> tuple[int, int]:
+        return self._cached_size
+
+    def _install_resize_handler(self) -> None:
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None or not self._use_ansi:
+            return
+        try:
+            self._loop.add_signal_handler(sigwinch, self._on_resize)
+        except (NotImplementedError, RuntimeError, ValueError) as e:
+            self.logger.debug(f"SIGWINCH handler not installed: {e}")
+
+    def _remove_resize_handler(self) -> None:
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None or not self._loop:
+            return
+        try:
+            self._loop.remove_signal_handler(sigwinch)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+
+    def _on_resize(self) -> None:
+        """
+        Refresh cached terminal size and schedule a redraw.
+        """
+        self._cached_size = self._query_term_size()
+        self._invalidate_frame()
+        # Input area moved with the bottom of the screen: redraw it with the typed content
+        self._render_input_area()
+        self._redraw_input_line()
+        self._dirty.set()
+
+    def _invalidate_frame(self) -> None:
+        """
+        Force the next dashboard render to repaint the whole frame.
+        """
+        self._last_body = []
+
     # ====== Raw input mode support, avoid Chinese residue ======
-    def _read_line_raw(self) -> str:
+    def _start_raw_input(self) -> bool:
         """
-        Read a line using raw mode: disable echo, read char by char and re-echo manually.  
-        Full line redraw avoids residue when deleting wide characters (Chinese).
+        Put the terminal into cbreak mode once and register a stdin reader.
+        Echo is disabled and lines are edited/redrawn manually.
         """
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
+        if not (self._use_ansi and sys.stdin.isatty()):
+            return False
         try:
-            tty.setraw(fd)
-            buffer: list[str] = []
-            while True:
-                ch = os.read(fd, 4)  # Read up to 4 bytes, enough for common UTF-8 Chinese
-                if not ch:
-                    break
-                try:
-                    s = ch.decode("utf-8")
-                except UnicodeDecodeError:
-                    # If incomplete UTF-8, keep reading until valid
-                    while True:
-                        ch += os.read(fd, 1)
-                        try:
-                            s = ch.decode("utf-8")
-                            break
-                        except UnicodeDecodeError:
-                            continue
-
-                if s in ("\r", "\n"):
-                    # Enter: newline, end input
-                    sys.stdout.write("\r\n")
-                    sys.stdout.flush()
+            fd = sys.stdin.fileno()
+            self._old_term_settings = termios.tcgetattr(fd)
+            # cbreak keeps ISIG/OPOST, so Ctrl+C still reaches the SIGINT handler
+            tty.setcbreak(fd)
+            self._loop.add_reader(fd, self._on_stdin_ready)
+            self._stdin_fd = fd
+            return True
+        except Exception as e:
+            self.logger.warning(f"Raw input unavailable, using line input: {e}")
+            self._stop_raw_input()
+            return False
+
+    def _stop_raw_input(self) -> None:
+        """
+        Remove the stdin reader and restore terminal settings (idempotent).
+        """
+        if self._stdin_fd is not None and self._loop:
+            try:
+                self._loop.remove_reader(self._stdin_fd)
+            except Exception:
+                pass
+        if self._old_term_settings is not None:
+            try:
+                termios.tcsetattr(
+                    sys.stdin.fileno(), termios.TCSADRAIN, self._old_term_settings
+                )
+            except Exception:
+                pass
+        self._stdin_fd = None
+        self._old_term_settings = None
+
+    def _on_stdin_ready(self) -> None:
+        """
+        Stdin reader callback: decode available bytes and edit the current line.
+        A whole burst (e.g. a paste) is read at once; normal characters are echoed
+        incrementally with one write per burst, full line redraw is only used on
+        backspace (avoids residue when deleting wide characters) or once the
+        content no longer fits on the line.
+        """
+        fd = self._stdin_fd
+        try:
+            data = os.read(fd, self._stdin_readahead)
+            # Buffer filled up: drain whatever else is already pending
+            while (
+                len(data) % self._stdin_readahead == 0
+                and select.select([fd], [], [], 0)[0]
+            ):
+                more = os.read(fd, self._stdin_readahead)
+                if not more:
                     break
-                elif s in ("\x7f", "\b"):
-                    # Backspace: delete one Unicode character
-                    if buffer:
-                        buffer.pop()
-                    # Redraw full line to avoid residue from wide characters
-                    self._redraw_input_line("".join(buffer))
-                elif s == "\x03":  # Ctrl+C
-                    raise KeyboardInterrupt
-                else:
-                    buffer.append(s)
-                    self._redraw_input_line("".join(buffer))
-
-            return "".join(buffer)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                data += more
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self.logger.error(f"Failed to read stdin: {e}")
+            self._stop_raw_input()
+            return
+        if not data:
+            self._stop_raw_input()
+            return
 
-    def _redraw_input_line(self, content: str) -> None:
+        # Incremental decoder keeps partial multibyte sequences across reads
+        text = self._utf8_decoder.decode(data)
+
+        echo: list[str] = []
+        redraw = False
+        max_len = self._input_max_len(self._term_size()[0])
+        for s in text:
+            # Skip escape sequences (arrow keys etc.) without dropping the rest of the burst
+            if self._esc_state == "esc":
+                self._esc_state = ""
+                if s in ("[", "O"):
+                    self._esc_state = "seq"
+                    continue
+            elif self._esc_state == "seq":
+                code = ord(s)
+                if 0x40 <= code <= 0x7E:
+                    # Final byte ends the sequence
+                    self._esc_state = ""
+                    continue
+                if 0x20 <= code <= 0x3F:
+                    # Parameter / intermediate bytes
+                    continue
+                # Malformed sequence: stop skipping and handle the character normally
+                self._esc_state = ""
+
+            if s == "\x1b":
+                self._esc_state = "esc"
+            elif s in ("\r", "\n"):
+                # Enter: end input, clear input area and hand the line over
+                line = "".join(self._line_buffer)
+                self._line_buffer.clear()
+                self._line_cells = 0
+                echo.clear()
+                redraw = False
+                self._clear_input_area()
+                # Repaint the full frame in case the terminal scrolled
+                self._invalidate_frame()
+                self._dirty.set()
+                self._render_input_area()
+                self._enqueue_input(line)
+            elif s in ("\x7f", "\b"):
+                # Backspace: delete one Unicode character
+                if self._line_buffer:
+                    self._line_cells -= self._cw(self._line_buffer.pop())
+                # Redraw full line to avoid residue from wide characters
+                redraw = True
+            elif s.isprintable():
+                self._line_buffer.append(s)
+                self._line_cells += self._cw(s)
+                if self._line_cells > max_len:
+                    redraw = True
+                elif not redraw:
+                    # Fast path: content still fits, just echo the new character
+                    echo.append(s)
+
+        if redraw:
+            self._redraw_input_line()
+        elif echo:
+            self._write(echo)
+
+    def _input_max_len(self, cols: int) -> int:
+        return max(1, cols - len("Input: ") - 1)
+
+    def _cw(self, ch: str) -> int:
+        """
+        Terminal cell width of a character (cached): 2 for wide/fullwidth, 0 for combining marks.
+        """
+        width = self._widths.get(ch)
+        if width is None:
+            if unicodedata.combining(ch):
+                width = 0
+            elif unicodedata.east_asian_width(ch) in ("W", "F"):
+                width = 2
+            else:
+                width = 1
+            self._widths[ch] = width
+        return width
+
+    def _redraw_input_line(self) -> None:
         """
         Clear input line and rewrite current content, ensuring no residue from deleting wide characters.
         """
         cols, rows = self._term_size()
         separator_row = max(1, rows - self._input_area_lines + 1)
         first_input_row = min(rows, separator_row + 1)
-        prompt = "Input: " if not self._use_ansi else "\x1b[1m\x1b[36mInput:\x1b[0m "
-        self._goto(first_input_row, 1)
-        sys.stdout.write("\x1b[2K")
-        visible = content
-        # Prevent wrapping if content exceeds one line
-        max_len = max(1, cols - len("Input: ") - 1)
-        if len(visible) > max_len:
-            visible = visible[-max_len:]
-        sys.stdout.write(f"{prompt}{visible}")
-        sys.stdout.flush()
+        buffer = self._line_buffer
+        # Prevent wrapping if content exceeds one line: keep the tail that fits, by cells
+        max_len = self._input_max_len(cols)
+        if self._line_cells <= max_len:
+            visible = "".join(buffer)
+        else:
+            cells = 0
+            start = len(buffer)
+            while start > 0:
+                w = self._cw(buffer[start - 1])
+                if cells + w > max_len:
+                    break
+                cells += w
+                start -= 1
+            visible = "".join(buffer[start:])
+        self._write([self._clear_row(first_input_row), self._prompt_str, visible])
 
     async def _render_dashboard(self, full: bool = False):
         """
@@ -324,6 +712,9 @@ class CliDisplay(BaseDisplay):
 
         # Truncate long text to avoid line breaks tearing interface
         def trunc(s: str, limit: int = 80) -> str:
+            # Line breaks/control characters would break out of the frame row
+            if not s.isprintable():
+                s = "".join(ch if ch.isprintable() else " " for ch in s)
             return s if len(s) <= limit else s[: limit - 1] + "…"
 
         lines = [
@@ -343,62 +734,63 @@ class CliDisplay(BaseDisplay):
         # Usable display rows = total terminal rows - input area lines
         usable_rows = max(5, rows - self._input_area_lines)
 
-        # Small style helper
-        def style(s: str, *names: str) -> str:
-            if not self._use_ansi:
-                return s
-            prefix = "".join(self._ansi.get(n, "") for n in names)
-            return f"{prefix}{s}{self._ansi['reset']}"
-
-        title = style(" XiaoZhi AI Terminal ", "bold", "cyan")
         # Top and bottom frames
-        top_bar = "┌" + ("─" * (max(2, cols - 2))) + "┐"
-        title_line = "│" + title.center(max(2, cols - 2)) + "│"
-        sep_line = "├" + ("─" * (max(2, cols - 2))) + "┤"
-        bottom_bar = "└" + ("─" * (max(2, cols - 2))) + "┘"
+        top_bar, sep_line, bottom_bar, title_line = self._frames(cols)
 
         # Body rows (excluding 4 lines for frames)
         body_rows = max(1, usable_rows - 4)
+        inner = max(2, cols - 2)
+        lines[0] = f"{self._green}{lines[0]}{self._reset}"
         body = []
         for i in range(body_rows):
             text = lines[i] if i < len(lines) else ""
-            text = style(text, "green") if i == 0 else text
-            body.append("│" + text.ljust(max(2, cols - 2))[: max(2, cols - 2)] + "│")
+            body.append("│" + text.ljust(inner)[:inner] + "│")
+
+        # Same geometry as the previous frame: borders are already on screen,
+        # only rewrite body rows whose content changed
+        last_body = self._last_body
+        incremental = (
+            not full and cols == self._last_cols and len(last_body) == body_rows
+        )
+        total_rows = 4 + body_rows
+        self._last_render_mono = time.monotonic()
+        if incremental and body == last_body:
+            return
 
         # Save cursor position
-        sys.stdout.write("\x1b7")
+        parts = ["\x1b7"]
 
-        # Clear previous frame fully to avoid overlapping visuals
-        total_rows = 4 + body_rows
-        rows_to_clear = max(self._last_drawn_rows, total_rows)
-        for i in range(rows_to_clear):
-            self._goto(1 + i, 1)
-            sys.stdout.write("\x1b[2K")
-
-        # Draw top
-        self._goto(1, 1)
-        sys.stdout.write("\x1b[2K" + top_bar[:cols])
-        self._goto(2, 1)
-        sys.stdout.write("\x1b[2K" + title_line[:cols])
-        self._goto(3, 1)
-        sys.stdout.write("\x1b[2K" + sep_line[:cols])
+        if not incremental:
+            # Every drawn row starts with \x1b[2K, so only rows left over from a
+            # taller previous frame need an explicit clear. Stop above the input
+            # area: rows past the terminal height would be clamped onto it.
+            clear_limit = min(self._last_drawn_rows, rows - self._input_area_lines)
+            for i in range(total_rows, clear_limit):
+                parts.append(self._clear_row(1 + i))
+
+            # Draw top
+            parts.append(self._clear_row(1) + top_bar[:cols])
+            parts.append(self._clear_row(2) + title_line[:cols])
+            parts.append(self._clear_row(3) + sep_line[:cols])
 
         # Draw body
         for idx in range(body_rows):
-            self._goto(4 + idx, 1)
-            sys.stdout.write("\x1b[2K")
-            sys.stdout.write(body[idx][:cols])
+            if incremental and body[idx] == last_body[idx]:
+                continue
+            parts.append(self._clear_row(4 + idx) + body[idx][:cols])
 
-        # Draw bottom
-        self._goto(4 + body_rows, 1)
-        sys.stdout.write("\x1b[2K" + bottom_bar[:cols])
+        if not incremental:
+            # Draw bottom
+            parts.append(self._clear_row(4 + body_rows) + bottom_bar[:cols])
 
         # Restore cursor
-        sys.stdout.write("\x1b8")
-        sys.stdout.flush()
+        parts.append("\x1b8")
+        self._write(parts)
 
-        # Record drawn rows
+        # Record drawn frame
         self._last_drawn_rows = total_rows
+        self._last_body = body
+        self._last_cols = cols
 
     def _clear_input_area(self):
         if not self._use_ansi:
@@ -408,12 +800,10 @@ class CliDisplay(BaseDisplay):
         first_input_row = min(rows, separator_row + 1)
         second_input_row = min(rows, separator_row + 2)
         # Clear separator and two input rows to avoid residue from wide characters
-        for r in [separator_row, first_input_row, second_input_row]:
-            self._goto(r, 1)
-            sys.stdout.write("\x1b[2K")
-        sys.stdout.flush()
+        rows_to_clear = (separator_row, first_input_row, second_input_row)
+        self._write([self._clear_row(r) for r in rows_to_clear])
 
-    async def _render_input_area(self):
+    def _render_input_area(self):
         if not self._use_ansi:
             return
         cols, rows = self._term_size()
@@ -421,29 +811,22 @@ class CliDisplay(BaseDisplay):
         first_input_row = min(rows, separator_row + 1)
         second_input_row = min(rows, separator_row + 2)
 
-        # Save cursor
-        sys.stdout.write("\x1b7")
-        # Separator line
-        self._goto(separator_row, 1)
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write("═" * max(1, cols))
-
-        # Input prompt line
-        self._goto(first_input_row, 1)
-        sys.stdout.write("\x1b[2K")
-        prompt = "Input: " if not self._use_ansi else "\x1b[1m\x1b[36mInput:\x1b[0m "
-        sys.stdout.write(prompt)
-
-        # Reserve overflow cleanup line
-        self._goto(second_input_row, 1)
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.flush()
-
-        # Restore cursor then move to input position
-        sys.stdout.write("\x1b8")
-        self._goto(first_input_row, 1)
-        sys.stdout.write(prompt)
-        sys.stdout.flush()
+        prompt = self._prompt_str
+        self._write(
+            [
+                # Save cursor
+                "\x1b7",
+                # Separator line
+                self._clear_row(separator_row) + "═" * max(1, cols),
+                # Input prompt line
+                self._clear_row(first_input_row) + prompt,
+                # Reserve overflow cleanup line
+                self._clear_row(second_input_row),
+                # Restore cursor then move to input position
+                "\x1b8",
+                self._goto(first_input_row, 1) + prompt,
+            ]
+        )
 
     async def toggle_mode(self):
         """